@@ -7,16 +7,84 @@ Provides commands to manage and inspect the archive system
 import sys
 import os
 import json
-import argparse
+import functools
+import itertools
 from datetime import datetime, timedelta
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from build_data import TrendsDataPipeline
+# build_data pulls in pytrends, pandas and numpy, so each command imports it on first use
+
+# Optional streaming parser for large archives
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Larger read size for the streaming parser so multi-MB archives need fewer read calls
+STREAM_BUFFER_SIZE = 128 * 1024
+
+# Number of result lines buffered before each stdout write
+OUTPUT_CHUNK_LINES = 64
+
+# File in the pipeline's cache directory (outside the served public/ tree) recording the
+# (size, mtime_ns) of archives that last validated OK, keyed by absolute archive path.
+# No .json suffix so the response cache cleanup leaves it alone.
+VALIDATION_CACHE_NAME = 'archive_validation'
+
+ARCHIVE_READ_ERRORS = (json.JSONDecodeError, IOError) + ((ijson.JSONError,) if ijson else ())
+
+def _read_archive_summary(filepath, sample_size=5):
+    """Read the header fields and the first few topics of an archive."""
+    if ijson is None:
+        from build_data import load_json
+        data = load_json(filepath)
+        return data, (data.get('topics') or [])[:sample_size]
+    
+    header = {}
+    with open(filepath, 'rb', buffering=0) as f:
+        # Scan parser events for the top-level scalars without building the topics list
+        for prefix, event, value in ijson.parse(f, buf_size=STREAM_BUFFER_SIZE):
+            if prefix in ('generatedAt', 'totalTopics'):
+                header[prefix] = value
+                if len(header) == 2:
+                    break
+        
+        f.seek(0)
+        sample = list(itertools.islice(ijson.items(f, 'topics.item', use_float=True, buf_size=STREAM_BUFFER_SIZE), sample_size))
+    
+    return header, sample
+
+def _load_validation_cache(cache_path):
+    """Load the validation cache, treating a missing or unreadable file as empty."""
+    from build_data import load_json
+    
+    try:
+        cache = load_json(cache_path)
+    except (ValueError, OSError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+def _save_validation_cache(cache_path, cache):
+    """Atomically replace the validation cache; failures only cost a re-validation."""
+    tmp_path = cache_path + '.tmp'
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(tmp_path, 'w') as f:
+            json.dump(cache, f)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+
+@functools.lru_cache(maxsize=1024)
+def _format_mtime(seconds: int) -> str:
+    """Format a whole-second mtime, cached since archives written together share it."""
+    return datetime.fromtimestamp(seconds).strftime('%Y-%m-%d %H:%M:%S')
 
 def list_archives():
     """List all archives with details."""
-    pipeline = TrendsDataPipeline()
-    stats = pipeline._get_archive_statistics()
+    import build_data
+    
+    stats = build_data.get_archive_statistics(build_data.ARCHIVE_DIR)
     
     if 'error' in stats:
         print(f"Error getting archive statistics: {stats['error']}")
@@ -28,106 +96,175 @@ def list_archives():
     print(f"  Date range: {stats['oldest_date']} to {stats['newest_date']}")
     print()
     
-    if stats.get('files'):
+    if stats.get('file_details'):
         print("Archive files:")
-        for filename in sorted(stats['files']):
-            filepath = os.path.join(pipeline.archive_dir, filename)
-            if os.path.exists(filepath):
-                file_size = os.path.getsize(filepath)
-                file_date = os.path.getmtime(filepath)
-                date_str = datetime.fromtimestamp(file_date).strftime('%Y-%m-%d %H:%M:%S')
-                print(f"  {filename:<25} {file_size:>8} bytes  {date_str}")
+        rows = sorted(stats['file_details'])
+        sys.stdout.write(''.join(
+            f"  {filename:<25} {file_size:>8} bytes  {_format_mtime(int(mtime))}\n"
+            for filename, file_size, mtime in rows
+        ))
     else:
         print("No archives found.")
 
 def validate_archives():
     """Validate all archives for integrity."""
-    pipeline = TrendsDataPipeline()
+    import build_data
     
-    if not os.path.exists(pipeline.archive_dir):
+    archive_dir = build_data.ARCHIVE_DIR
+    
+    if not os.path.exists(archive_dir):
         print("No archive directory found.")
         return
     
     valid_count = 0
     invalid_count = 0
     
-    for filename in os.listdir(pipeline.archive_dir):
-        if filename.endswith('.json') and filename != 'latest.json':
-            filepath = os.path.join(pipeline.archive_dir, filename)
-            
-            if pipeline._validate_archive(filepath):
-                print(f"✅ {filename}")
-                valid_count += 1
-            else:
-                print(f"❌ {filename}")
-                invalid_count += 1
+    cache_path = os.path.join(build_data.CACHE_DIR, VALIDATION_CACHE_NAME)
+    cache = _load_validation_cache(cache_path)
+    
+    # Entries for other archive directories are carried over untouched
+    abs_archive_dir = os.path.abspath(archive_dir)
+    new_cache = {path: signature for path, signature in cache.items()
+                 if os.path.dirname(path) != abs_archive_dir}
+    
+    # Empty files can't be valid JSON and unchanged files already passed, so only
+    # the rest go to the validator
+    results = {}
+    signatures = {}
+    with os.scandir(archive_dir) as it:
+        for entry in it:
+            if entry.name.endswith('.json') and entry.name != 'latest.json':
+                file_stat = entry.stat()
+                signature = [file_stat.st_size, file_stat.st_mtime_ns]
+                cache_key = os.path.join(abs_archive_dir, entry.name)
+                if file_stat.st_size == 0:
+                    results[entry.path] = False
+                elif cache.get(cache_key) == signature:
+                    results[entry.path] = True
+                    new_cache[cache_key] = signature
+                else:
+                    signatures[entry.path] = (cache_key, signature)
+    
+    batch_results = build_data.validate_archives_batch(list(signatures))
+    for filepath, is_valid in batch_results.items():
+        if is_valid:
+            cache_key, signature = signatures[filepath]
+            new_cache[cache_key] = signature
+    results.update(batch_results)
+    
+    if new_cache != cache:
+        _save_validation_cache(cache_path, new_cache)
+    
+    # Emit result lines in chunks rather than one print() per archive
+    out = []
+    for filepath in sorted(results):
+        filename = os.path.basename(filepath)
+        if results[filepath]:
+            out.append(f"✅ {filename}\n")
+            valid_count += 1
+        else:
+            out.append(f"❌ {filename}\n")
+            invalid_count += 1
+        
+        if len(out) >= OUTPUT_CHUNK_LINES:
+            sys.stdout.write(''.join(out))
+            out.clear()
+    sys.stdout.write(''.join(out))
     
     print(f"\nValidation complete: {valid_count} valid, {invalid_count} invalid")
 
 def cleanup_archives():
     """Manually trigger archive cleanup."""
-    pipeline = TrendsDataPipeline()
+    import build_data
     
     print("Running archive cleanup...")
-    pipeline._cleanup_archives()
+    build_data.cleanup_archives(build_data.ARCHIVE_DIR)
     
-    stats = pipeline._get_archive_statistics()
+    stats = build_data.get_archive_statistics(build_data.ARCHIVE_DIR)
     if 'error' not in stats:
         print(f"Cleanup complete: {stats['total_archives']} archives remaining")
 
 def show_archive_details(filename):
     """Show detailed information about a specific archive."""
-    pipeline = TrendsDataPipeline()
-    filepath = os.path.join(pipeline.archive_dir, filename)
+    from build_data import ARCHIVE_DIR
+    
+    filepath = os.path.join(ARCHIVE_DIR, filename)
     
-    if not os.path.exists(filepath):
+    try:
+        file_size = os.stat(filepath).st_size
+    except FileNotFoundError:
         print(f"Archive file not found: {filename}")
         return
     
     try:
-        with open(filepath, 'r') as f:
-            data = json.load(f)
+        header, sample = _read_archive_summary(filepath)
+        total_topics = header.get('totalTopics', 0)
         
         print(f"Archive Details: {filename}")
-        print(f"  Generated: {data.get('generatedAt', 'Unknown')}")
-        print(f"  Total topics: {data.get('totalTopics', 0)}")
+        print(f"  Generated: {header.get('generatedAt', 'Unknown')}")
+        print(f"  Total topics: {total_topics}")
         
-        if 'topics' in data and data['topics']:
-            topics = data['topics']
+        if sample:
             print(f"  Sample topics:")
-            for i, topic in enumerate(topics[:5]):  # Show first 5 topics
+            for i, topic in enumerate(sample):  # Show first 5 topics
                 print(f"    {i+1}. {topic.get('term', 'Unknown')} (score: {topic.get('score', 0):.2f})")
             
-            if len(topics) > 5:
-                print(f"    ... and {len(topics) - 5} more")
+            if total_topics > len(sample):
+                print(f"    ... and {total_topics - len(sample)} more")
         
         # File size
-        file_size = os.path.getsize(filepath)
         print(f"  File size: {file_size} bytes ({file_size / 1024:.1f}KB)")
         
-    except (json.JSONDecodeError, IOError) as e:
+    except ARCHIVE_READ_ERRORS as e:
         print(f"Error reading archive: {e}")
 
-def main():
-    """Main command line interface."""
+COMMANDS = ['list', 'validate', 'cleanup', 'show']
+
+def _build_parser():
+    """Build the argparse parser, only needed for help output and usage errors."""
+    import argparse
+    
     parser = argparse.ArgumentParser(description='Archive Management Utility')
-    parser.add_argument('command', choices=['list', 'validate', 'cleanup', 'show'],
+    parser.add_argument('command', choices=COMMANDS,
                        help='Command to execute')
     parser.add_argument('--file', help='Archive filename for show command')
+    return parser
+
+def _parse_args(argv):
+    """Parse `command [--file NAME]` by hand, returning None when argparse is needed."""
+    if not argv or argv[0] not in COMMANDS:
+        return None
+    
+    command, rest = argv[0], argv[1:]
+    if not rest:
+        return command, None
+    if len(rest) == 2 and rest[0] == '--file':
+        return command, rest[1]
+    if len(rest) == 1 and rest[0].startswith('--file='):
+        return command, rest[0][len('--file='):]
+    return None
+
+def main():
+    """Main command line interface."""
+    parsed = _parse_args(sys.argv[1:])
+    if parsed is None:
+        # Help, usage errors and less common argument orders go through argparse
+        args = _build_parser().parse_args()
+        parsed = (args.command, args.file)
     
-    args = parser.parse_args()
+    command, file_arg = parsed
     
-    if args.command == 'list':
+    if command == 'list':
         list_archives()
-    elif args.command == 'validate':
+    elif command == 'validate':
         validate_archives()
-    elif args.command == 'cleanup':
+    elif command == 'cleanup':
         cleanup_archives()
-    elif args.command == 'show':
-        if not args.file:
+    elif command == 'show':
+        if not file_arg:
             print("Error: --file required for show command")
             sys.exit(1)
-        show_archive_details(args.file)
+        show_archive_details(file_arg)
 
 if __name__ == "__main__":
     main()
@@ -8,23 +8,136 @@ import json
 import os
 import sys
 import logging
-from datetime import datetime, timedelta
+import hashlib
+import heapq
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import date, datetime, timedelta
 from typing import Dict, List, Tuple, Optional
 import time
 import random
+import threading
+import traceback
 
 # Third-party imports
 try:
     from pytrends.request import TrendReq
     from pytrends.exceptions import ResponseError, TooManyRequestsError
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
     from rapidfuzz import fuzz, process
     import numpy as np
-    import pandas as pd
 except ImportError as e:
     print(f"Missing required package: {e}")
     print("Please install requirements: pip install -r requirements.txt")
     sys.exit(1)
 
+# Optional speedups
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def parse_json(buf: bytes):
+    """Parse a JSON document from bytes, using orjson when it is available."""
+    return orjson.loads(buf) if orjson else json.loads(buf)
+
+def load_json(filepath: str):
+    """Load a JSON file, using orjson when it is available."""
+    # Unbuffered so read() goes straight to a single fstat-sized read of the whole file
+    with open(filepath, 'rb', buffering=0) as f:
+        return parse_json(f.readall())
+
+def dump_json(data) -> bytes:
+    """Serialize data to compact JSON bytes, using orjson when it is available."""
+    if orjson:
+        return orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(data, separators=(',', ':')).encode()
+
+def write_atomic(filepath: str, data: bytes):
+    """Write bytes via a temp file in the same directory, so readers never see a partial file."""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(filepath) or '.', suffix='.tmp')
+    try:
+        os.fchmod(fd, 0o644)  # mkstemp creates 0600; output files are served to the site
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+OUTPUT_DIR = "public/data"
+ARCHIVE_DIR = os.path.join(OUTPUT_DIR, "archive")
+CACHE_DIR = os.path.join("data", "cache")
+
+# Archive batches smaller than this are validated serially; below it, worker start-up
+# (and re-importing this module under spawn) costs more than the parsing saved
+PARALLEL_VALIDATION_MIN_FILES = 200
+
+# Fields every archive (and its topics) must carry, built once for all validations
+ARCHIVE_REQUIRED_FIELDS = frozenset(('generatedAt', 'totalTopics', 'topics'))
+TOPIC_REQUIRED_FIELDS = frozenset(('term', 'category', 'score', 'sparkline'))
+
+# Characters dropped when normalizing terms for dedup
+_DEDUP_STRIP_TABLE = str.maketrans('', '', '-_.')
+
+def normalize_term_for_dedup(term: str) -> str:
+    """Normalize a term for dedup matching: lowercase, drop -_. and collapse whitespace.
+    
+    This helps with abbreviations like "A.I." -> "ai" and "Chat-GPT" -> "chatgpt".
+    """
+    # split() also strips the ends, and beats a regex substitution on short terms
+    return ' '.join(term.lower().translate(_DEDUP_STRIP_TABLE).split())
+
+# Closed-form least-squares slope over the last 8 weeks. With x = 0..7 centered on its
+# mean the centered weights sum to zero, so the slope is one dot product: xc·y / xc·xc
+SLOPE_WINDOW = 8
+_SLOPE_XC = np.arange(SLOPE_WINDOW, dtype=np.float64) - (SLOPE_WINDOW - 1) / 2
+_SLOPE_XC_SS = np.dot(_SLOPE_XC, _SLOPE_XC)
+
+def _slope_8_weeks(y: np.ndarray) -> float:
+    """Slope of a least-squares line through 8 weekly values."""
+    return float(np.dot(_SLOPE_XC, y) / _SLOPE_XC_SS)
+
+def _archive_file_date(filename: str) -> Optional[date]:
+    """Return the date in a YYYY-MM-DD.json archive name, or None for any other name.
+    
+    Archive names have a fixed layout, so slicing avoids the slow strptime machinery.
+    """
+    stem = filename[:-5] if filename.endswith('.json') else filename
+    if len(stem) != 10 or stem[4] != '-' or stem[7] != '-':
+        return None
+    if not (stem[:4] + stem[5:7] + stem[8:]).isdigit():
+        return None
+    try:
+        return date(int(stem[:4]), int(stem[5:7]), int(stem[8:]))
+    except ValueError:
+        return None
+
+def _archive_entries(archive_dir: str) -> Optional[List[Tuple[str, date, int, float]]]:
+    """Return (name, date, size, mtime) for each archive file, or None if the directory is missing.
+    
+    Names that are not YYYY-MM-DD.json are dated by their modification time.
+    """
+    entries = []
+    try:
+        with os.scandir(archive_dir) as it:
+            for entry in it:
+                if not entry.name.endswith('.json') or entry.name == 'latest.json':
+                    continue
+                file_stat = entry.stat()
+                file_date = _archive_file_date(entry.name)
+                if file_date is None:
+                    file_date = datetime.fromtimestamp(file_stat.st_mtime).date()
+                entries.append((entry.name, file_date, file_stat.st_size, file_stat.st_mtime))
+    except FileNotFoundError:
+        return None
+    return entries
+
 # Configure comprehensive logging
 def setup_logging():
     """Set up comprehensive logging with multiple handlers and levels."""
@@ -73,10 +186,104 @@ def setup_logging():
 logger = setup_logging()
 
 # Error tracking and metrics
+class PooledTrendReq(TrendReq):
+    """TrendReq that sends every request through one keep-alive session.
+    
+    Stock pytrends opens a fresh requests session, and so a new TCP/TLS connection,
+    for every call. A session is not thread-safe, so use one client per thread.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        self._session = None
+        super().__init__(*args, **kwargs)
+    
+    def _get_session(self) -> requests.Session:
+        if self._session is None:
+            session = requests.Session()
+            if self.retries > 0 or self.backoff_factor > 0:
+                # 429 is never retried here (urllib3 would otherwise retry any status with a
+                # Retry-After header), so it surfaces as TooManyRequestsError and the pipeline
+                # pauses every worker rather than just sleeping on this thread
+                retry = Retry(total=self.retries, read=self.retries, connect=self.retries,
+                              backoff_factor=self.backoff_factor,
+                              status_forcelist=[code for code in TrendReq.ERROR_CODES
+                                                if code != requests.codes.too_many_requests],
+                              respect_retry_after_header=False,
+                              allowed_methods=frozenset(['GET', 'POST']))
+                session.mount('https://', HTTPAdapter(max_retries=retry))
+            session.headers.update(self.headers)
+            self._session = session
+        return self._session
+    
+    def _get_data(self, url, method=TrendReq.GET_METHOD, trim_chars=0, **kwargs):
+        """Send a request to Google and return the JSON response, as TrendReq._get_data does."""
+        if self.proxies:
+            # Proxy rotation refreshes cookies per request; leave that to pytrends
+            return super()._get_data(url, method=method, trim_chars=trim_chars, **kwargs)
+        
+        session = self._get_session()
+        send = session.post if method == TrendReq.POST_METHOD else session.get
+        response = send(url, timeout=self.timeout, cookies=self.cookies, **kwargs, **self.requests_args)
+        
+        # Google labels JSON as application/json, application/javascript or text/javascript
+        content_type = response.headers.get('Content-Type', '')
+        if (response.status_code == 200 and 'application/json' in content_type) or \
+                'application/javascript' in content_type or 'text/javascript' in content_type:
+            # Some responses start with garbage characters, like ")]}',". They are ASCII, so
+            # trimming the raw bytes matches trimming the text and skips charset decoding.
+            return parse_json(response.content[trim_chars:])
+        if response.status_code == requests.codes.too_many_requests:
+            raise TooManyRequestsError.from_response(response)
+        raise ResponseError.from_response(response)
+    
+    def interest_values(self) -> Dict[str, List[int]]:
+        """interest_over_time() without the DataFrame: weekly values per keyword, oldest first."""
+        req_json = self._get_data(
+            url=TrendReq.INTEREST_OVER_TIME_URL,
+            method=TrendReq.GET_METHOD,
+            trim_chars=5,
+            params={
+                'req': json.dumps(self.interest_over_time_widget['request']),
+                'token': self.interest_over_time_widget['token'],
+                'tz': self.tz
+            },
+        )
+        timeline = sorted(req_json['default']['timelineData'], key=lambda point: float(point['time']))
+        return {kw: [int(point['value'][idx]) for point in timeline] for idx, kw in enumerate(self.kw_list)}
+    
+    def related_query_lists(self) -> Dict[str, Dict[str, Optional[List[str]]]]:
+        """related_queries() without the DataFrames: top and rising query strings per keyword.
+        
+        As in pytrends, a missing or empty list is None.
+        """
+        result = {}
+        for widget in self.related_queries_widget_list:
+            try:
+                kw = widget['request']['restriction']['complexKeywordsRestriction']['keyword'][0]['value']
+            except KeyError:
+                kw = ''
+            req_json = self._get_data(
+                url=TrendReq.RELATED_QUERIES_URL,
+                method=TrendReq.GET_METHOD,
+                trim_chars=5,
+                params={'req': json.dumps(widget['request']), 'token': widget['token'], 'tz': self.tz},
+            )
+            ranked = req_json['default']['rankedList']
+            lists = []
+            for position in (0, 1):  # top, rising
+                try:
+                    keywords = ranked[position]['rankedKeyword']
+                except (IndexError, KeyError):
+                    keywords = None
+                lists.append([entry['query'] for entry in keywords] if keywords else None)
+            result[kw] = {'top': lists[0], 'rising': lists[1]}
+        return result
+
 class ErrorTracker:
     """Track errors and performance metrics."""
     
     def __init__(self):
+        self._lock = threading.Lock()  # Terms are fetched from several threads
         self.errors = []
         self.warnings = []
         self.metrics = {
@@ -112,10 +319,11 @@ class ErrorTracker:
     
     def increment_metric(self, metric_name: str, value: int = 1):
         """Increment a metric counter."""
-        if metric_name in self.metrics:
-            self.metrics[metric_name] += value
-        else:
-            self.metrics[metric_name] = value
+        with self._lock:
+            if metric_name in self.metrics:
+                self.metrics[metric_name] += value
+            else:
+                self.metrics[metric_name] = value
     
     def get_summary(self) -> dict:
         """Get error and performance summary."""
@@ -127,42 +335,174 @@ class ErrorTracker:
             'warning_types': list(set(w['type'] for w in self.warnings))
         }
 
+# Archive helpers live at module level so read-only tools can use them without a pipeline
+def cleanup_archives(archive_dir: str = None):
+    """Keep only the last 7 days of archives with date-based cleanup."""
+    archive_dir = archive_dir or ARCHIVE_DIR
+    try:
+        archive_files = []
+        current_date = datetime.now().date()
+        
+        # Collect all archive files with their dates in one directory pass
+        entries = _archive_entries(archive_dir)
+        if entries is None:
+            return
+        for filename, file_date, file_size, mtime in entries:
+            # Calculate days difference
+            days_old = (current_date - file_date).days
+            archive_files.append((os.path.join(archive_dir, filename), file_date, days_old))
+        
+        # Sort by date (newest first)
+        archive_files.sort(key=lambda x: x[1], reverse=True)
+        
+        # Remove files older than 7 days
+        removed_count = 0
+        for filepath, file_date, days_old in archive_files:
+            if days_old > 7:
+                try:
+                    os.remove(filepath)
+                    logger.info(f"Removed old archive: {os.path.basename(filepath)} ({days_old} days old)")
+                    removed_count += 1
+                except OSError as e:
+                    logger.warning(f"Could not remove archive {filepath}: {e}")
+        
+        # Log archive statistics
+        remaining_count = len(archive_files) - removed_count
+        logger.info(f"Archive cleanup complete: {removed_count} removed, {remaining_count} remaining")
+        
+        # List remaining archives
+        if remaining_count > 0:
+            logger.debug("Remaining archives:")
+            for filepath, file_date, days_old in archive_files[:remaining_count]:
+                logger.debug(f"  {os.path.basename(filepath)} ({days_old} days old)")
+            
+    except Exception as e:
+        logger.error(f"Error cleaning up archives: {e}")
+
+def validate_archive(filepath: str) -> bool:
+    """Validate that an archive file is properly formatted."""
+    try:
+        with open(filepath, 'rb', buffering=0) as f:
+            # Cheap structural sniff so truncated or non-object files skip the full parse
+            head = f.read(256)
+            f.seek(max(0, os.fstat(f.fileno()).st_size - 16))
+            tail = f.read()
+            if not head.lstrip().startswith(b'{') or not tail.rstrip().endswith(b'}'):
+                logger.warning(f"Archive {filepath} is corrupted: not a complete JSON object")
+                return False
+            
+            f.seek(0)
+            data = parse_json(f.readall())
+        
+        return validate_archive_data(data, filepath)
+        
+    except (json.JSONDecodeError, IOError) as e:
+        logger.warning(f"Archive {filepath} is corrupted: {e}")
+        return False
+
+def validate_archive_data(data, source: str) -> bool:
+    """Validate the structure of an already-parsed archive document."""
+    # Check required fields
+    if not isinstance(data, dict) or not data.keys() >= ARCHIVE_REQUIRED_FIELDS:
+        logger.warning(f"Archive {source} missing required fields")
+        return False
+    
+    # Check topics structure
+    if not isinstance(data['topics'], list):
+        logger.warning(f"Archive {source} has invalid topics structure")
+        return False
+    
+    # Check topic structure (at least one topic should have required fields)
+    if data['topics']:
+        topic = data['topics'][0]
+        if not isinstance(topic, dict) or not topic.keys() >= TOPIC_REQUIRED_FIELDS:
+            logger.warning(f"Archive {source} has invalid topic structure")
+            return False
+    
+    return True
+
+def validate_archives_batch(paths: List[str]) -> Dict[str, bool]:
+    """Validate several archive files across worker processes, returning a result per path."""
+    if not paths:
+        return {}
+    
+    # JSON parsing is CPU-bound and holds the GIL, so spread files over processes, but
+    # only for large batches: the usual 7-day window validates far faster than a pool starts
+    max_workers = min(len(paths), os.cpu_count() or 1)
+    if max_workers == 1 or len(paths) < PARALLEL_VALIDATION_MIN_FILES:
+        return {path: validate_archive(path) for path in paths}
+    
+    chunksize = max(1, len(paths) // (max_workers * 4))
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return dict(zip(paths, executor.map(validate_archive, paths, chunksize=chunksize)))
+
+def get_archive_statistics(archive_dir: str = None) -> Dict:
+    """Get statistics about the archive system."""
+    archive_dir = archive_dir or ARCHIVE_DIR
+    try:
+        archive_files = _archive_entries(archive_dir)
+        if not archive_files:
+            return {'total_archives': 0, 'total_size_kb': 0, 'oldest_date': None, 'newest_date': None}
+        
+        # Sort by date
+        archive_files.sort(key=lambda x: x[1])
+        
+        return {
+            'total_archives': len(archive_files),
+            'total_size_kb': round(sum(f[2] for f in archive_files) / 1024, 1),
+            'oldest_date': archive_files[0][1].isoformat(),
+            'newest_date': archive_files[-1][1].isoformat(),
+            'files': [f[0] for f in archive_files],
+            'file_details': [(f[0], f[2], f[3]) for f in archive_files]
+        }
+        
+    except Exception as e:
+        logger.error(f"Error getting archive statistics: {e}")
+        return {'error': str(e)}
+
 class TrendsDataPipeline:
     def __init__(self, seeds_file: str = "data/seeds.json"):
         """Initialize the data pipeline with seeds configuration."""
         self.seeds_file = seeds_file
-        self.output_dir = "public/data"
-        self.archive_dir = os.path.join(self.output_dir, "archive")
+        self.output_dir = OUTPUT_DIR
+        self.archive_dir = ARCHIVE_DIR
         self.latest_file = os.path.join(self.output_dir, "latest.json")
+        self.cache_dir = CACHE_DIR
         
         # Initialize error tracking
         self.error_tracker = ErrorTracker()
-        self.error_tracker.metrics['start_time'] = datetime.now().isoformat()
+        self._set_run_timestamp()
         
         try:
             # Ensure directories exist
             os.makedirs(self.output_dir, exist_ok=True)
             os.makedirs(self.archive_dir, exist_ok=True)
+            os.makedirs(self.cache_dir, exist_ok=True)
             logger.debug("Output directories created successfully")
             
             # Load seeds data
             self.seeds_data = self._load_seeds()
+            self.min_volume = self.seeds_data.get('globalSettings', {}).get('minVolumeThreshold', 10)
             
             # Initialize pytrends with rate limiting
-            self.pytrends = TrendReq(
-                hl='en-US',
-                tz=360,
-                timeout=(10, 25),
-                retries=2,
-                backoff_factor=0.1,
-                requests_args={'verify': False}
-            )
+            self.pytrends = self._create_trends_client()
+            self._thread_local = threading.local()
             logger.debug("Pytrends initialized successfully")
             
             # Rate limiting settings
             self.min_delay = 12  # Minimum seconds between requests
             self.max_delay = 15  # Maximum seconds between requests
             self.last_request_time = 0
+            self._rate_lock = threading.Lock()
+            self.paused_until = 0  # No requests before this time, set after a 429
+            self.rate_limit_backoff = 60  # Seconds to pause all requests after a 429 without Retry-After
+            
+            # Terms fetched concurrently; _rate_limit still spaces requests across all workers
+            self.fetch_workers = 4
+            
+            # Seconds a cached API response stays valid; entries also roll over each day, so
+            # the cache only saves requests when a run is retried on the same day
+            self.cache_ttl = 24 * 3600
             
         except Exception as e:
             self.error_tracker.log_error(
@@ -184,28 +524,131 @@ class TrendsDataPipeline:
             logger.error(f"Invalid JSON in seeds file: {e}")
             sys.exit(1)
     
-    def _rate_limit(self):
-        """Implement rate limiting between requests."""
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
+    def _create_trends_client(self) -> TrendReq:
+        """Create a pytrends client with the pipeline's connection settings."""
+        return PooledTrendReq(
+            hl='en-US',
+            tz=360,
+            timeout=(10, 25),
+            retries=2,
+            backoff_factor=0.1
+        )
+    
+    def _get_client(self) -> TrendReq:
+        """Return the pytrends client for the current thread, since clients hold per-request state."""
+        if threading.current_thread() is threading.main_thread():
+            return self.pytrends
         
-        if time_since_last < self.min_delay:
-            sleep_time = self.min_delay - time_since_last + random.uniform(0, 3)
+        client = getattr(self._thread_local, 'pytrends', None)
+        if client is None:
+            client = self._create_trends_client()
+            self._thread_local.pytrends = client
+        return client
+    
+    def _rate_limit(self):
+        """Implement rate limiting between requests, shared by all fetch threads."""
+        slot = None
+        while True:
+            with self._rate_lock:
+                current_time = time.time()
+                
+                # A slot reserved before a 429 pause is void; queue again behind the pause
+                if slot is not None and slot < self.paused_until:
+                    slot = None
+                
+                if slot is None:
+                    start_time = max(current_time, self.paused_until)
+                    time_since_last = start_time - self.last_request_time
+                    
+                    delay = 0
+                    if time_since_last < self.min_delay:
+                        delay = self.min_delay - time_since_last + random.uniform(0, 3)
+                    
+                    # Reserve this request's slot so other threads queue up behind it
+                    slot = start_time + delay
+                    self.last_request_time = slot
+                
+                sleep_time = slot - current_time
+            
+            # Re-check after sleeping, since a 429 may have paused requests meanwhile
+            if sleep_time <= 0:
+                return
             logger.info(f"Rate limiting: sleeping for {sleep_time:.1f} seconds")
             time.sleep(sleep_time)
+    
+    def _back_off(self, error: TooManyRequestsError):
+        """Pause every thread's requests after Google answers 429.
+        
+        Honors a Retry-After header given in seconds, otherwise waits rate_limit_backoff.
+        Threads already sleeping in _rate_limit see the pause when they wake.
+        """
+        retry_after = error.response.headers.get('Retry-After', '') if error.response is not None else ''
+        delay = float(retry_after) if retry_after.isdigit() else self.rate_limit_backoff
+        with self._rate_lock:
+            self.paused_until = max(self.paused_until, time.time() + delay)
+        logger.warning(f"Rate limited by Google Trends: pausing requests for {delay:.0f} seconds")
+    
+    def _set_run_timestamp(self):
+        """Capture the timestamp shared by every topic produced in this run."""
+        self.run_started_at = datetime.now()
+        self.run_started_iso = self.run_started_at.isoformat()
+        self.error_tracker.metrics['start_time'] = self.run_started_iso
+    
+    def _cache_path(self, kind: str, term: str, timeframe: str) -> str:
+        """Cache file for a term's API response on the run's date.
         
-        self.last_request_time = time.time()
+        Keyed by day, not week: the last weekly point is partial and Google revises it daily.
+        """
+        run_date = self.run_started_at.date().isoformat()
+        key = hashlib.sha1(f"{kind}|{term}|{timeframe}|{run_date}".encode()).hexdigest()
+        return os.path.join(self.cache_dir, f"{key}.json")
+    
+    def _read_cache(self, cache_path: str) -> Optional[List]:
+        """Read a cached response, treating a missing, expired or corrupt entry as a miss."""
+        try:
+            if time.time() - os.path.getmtime(cache_path) > self.cache_ttl:
+                return None
+            values = load_json(cache_path)
+        except (ValueError, OSError):
+            return None
+        return values if isinstance(values, list) else None
+    
+    def _write_cache(self, cache_path: str, values: List):
+        """Atomically write a response to the cache."""
+        try:
+            write_atomic(cache_path, dump_json(values))
+        except OSError as e:
+            logger.warning(f"Could not write response cache for {cache_path}: {e}")
+    
+    def _cleanup_cache(self):
+        """Remove cached responses older than the cache TTL."""
+        cutoff = time.time() - self.cache_ttl
+        try:
+            with os.scandir(self.cache_dir) as it:
+                for entry in it:
+                    if entry.name.endswith(('.json', '.tmp')) and entry.stat().st_mtime < cutoff:
+                        os.remove(entry.path)
+        except OSError as e:
+            logger.warning(f"Error cleaning up response cache: {e}")
     
     def _get_interest_over_time(self, term: str, timeframe: str = "today 12-m") -> Optional[List[int]]:
         """Get interest over time data for a single term."""
+        cache_path = self._cache_path('interest', term, timeframe)
+        cached = self._read_cache(cache_path)
+        if cached is not None:
+            logger.debug(f"Using cached interest data for {term}")
+            return cached
+        
         try:
             self._rate_limit()
             self.error_tracker.increment_metric('api_calls')
             
-            self.pytrends.build_payload([term], timeframe=timeframe, geo='', gprop='')
-            interest_data = self.pytrends.interest_over_time()
+            client = self._get_client()
+            client.build_payload([term], timeframe=timeframe, geo='', gprop='')
+            self._thread_local.payload = (term, timeframe)
+            interest_data = client.interest_values()
             
-            if interest_data.empty or term not in interest_data.columns:
+            if not interest_data.get(term):
                 self.error_tracker.log_warning(
                     'NO_DATA',
                     f"No interest data for term: {term}",
@@ -214,7 +657,7 @@ class TrendsDataPipeline:
                 return None
             
             # Get the last 52 weeks of data (weekly)
-            values = interest_data[term].tolist()
+            values = interest_data[term]
             if len(values) < 8:  # Need at least 8 weeks for meaningful analysis
                 self.error_tracker.log_warning(
                     'INSUFFICIENT_DATA',
@@ -224,9 +667,13 @@ class TrendsDataPipeline:
                 return None
                 
             logger.debug(f"Successfully retrieved {len(values)} data points for {term}")
-            return values[-52:] if len(values) > 52 else values  # Cap at 52 weeks
+            values = values[-52:] if len(values) > 52 else values  # Cap at 52 weeks
+            self._write_cache(cache_path, values)
+            return values
             
         except (ResponseError, TooManyRequestsError) as e:
+            if isinstance(e, TooManyRequestsError):
+                self._back_off(e)
             self.error_tracker.increment_metric('api_errors')
             self.error_tracker.log_error(
                 'API_ERROR',
@@ -243,13 +690,26 @@ class TrendsDataPipeline:
             )
             return None
     
-    def _get_related_queries(self, term: str) -> List[str]:
-        """Get related queries (top + rising) for a term."""
+    def _get_related_queries(self, term: str, reuse_payload: bool = False) -> List[str]:
+        """Get related queries (top + rising) for a term.
+        
+        With reuse_payload, the payload _get_interest_over_time just built on this thread
+        is used when it matches, saving a round-trip.
+        """
+        cache_path = self._cache_path('related', term, "today 12-m")
+        cached = self._read_cache(cache_path)
+        if cached is not None:
+            logger.debug(f"Using cached related queries for {term}")
+            return cached
+        
         try:
-            self._rate_limit()
-            
-            self.pytrends.build_payload([term], timeframe="today 12-m", geo='', gprop='')
-            related_data = self.pytrends.related_queries()
+            client = self._get_client()
+            payload = (term, "today 12-m")
+            if not reuse_payload or getattr(self._thread_local, 'payload', None) != payload:
+                self._rate_limit()
+                client.build_payload([term], timeframe="today 12-m", geo='', gprop='')
+                self._thread_local.payload = payload
+            related_data = client.related_query_lists()
             
             if term not in related_data or related_data[term] is None:
                 return []
@@ -258,17 +718,20 @@ class TrendsDataPipeline:
             
             # Get top queries
             if 'top' in related_data[term] and related_data[term]['top'] is not None:
-                top_queries = related_data[term]['top']['query'].tolist()[:5]  # Top 5
+                top_queries = related_data[term]['top'][:5]  # Top 5
                 related_queries.extend(top_queries)
             
             # Get rising queries
             if 'rising' in related_data[term] and related_data[term]['rising'] is not None:
-                rising_queries = related_data[term]['rising']['query'].tolist()[:5]  # Top 5
+                rising_queries = related_data[term]['rising'][:5]  # Top 5
                 related_queries.extend(rising_queries)
             
+            self._write_cache(cache_path, related_queries)
             return related_queries
             
         except (ResponseError, TooManyRequestsError) as e:
+            if isinstance(e, TooManyRequestsError):
+                self._back_off(e)
             logger.error(f"Related queries error for term {term}: {e}")
             return []
         except Exception as e:
@@ -283,15 +746,13 @@ class TrendsDataPipeline:
         all_weeks = sparkline
         
         # Calculate slope (trend over last 8 weeks)
-        last_8_weeks = sparkline[-8:]
-        x = np.arange(len(last_8_weeks))
-        y = np.array(last_8_weeks)
-        slope = np.polyfit(x, y, 1)[0] if len(last_8_weeks) > 1 else 0
+        y = np.asarray(sparkline[-8:], dtype=np.float64)
+        slope = _slope_8_weeks(y)
         
         # Calculate percent change (last 4 weeks vs previous 4 weeks)
         if len(all_weeks) >= 8:
-            recent_4 = np.mean(all_weeks[-4:])
-            previous_4 = np.mean(all_weeks[-8:-4])
+            recent_4 = y[-4:].sum() * 0.25
+            previous_4 = y[:4].sum() * 0.25
             percent_change = ((recent_4 - previous_4) / previous_4 * 100) if previous_4 > 0 else 0
         else:
             percent_change = 0
@@ -301,32 +762,22 @@ class TrendsDataPipeline:
         
         return slope, percent_change, volatility
     
-    def _normalize_score(self, values: List[float]) -> List[float]:
+    def _normalize_score(self, values: List[float]) -> np.ndarray:
         """Normalize scores using z-score normalization."""
-        if not values or len(values) < 2:
-            return [0.0] * len(values)
+        values = np.asarray(values, dtype=np.float64)
+        if values.size < 2:
+            return np.zeros(values.size)
         
-        mean_val = np.mean(values)
-        std_val = np.std(values)
+        std_val = values.std()
         
         if std_val == 0:
-            return [0.0] * len(values)
+            return np.zeros(values.size)
         
-        return [(val - mean_val) / std_val for val in values]
+        return (values - values.mean()) / std_val
     
     def _normalize_term_for_dedup(self, term: str) -> str:
         """Normalize term for better deduplication matching."""
-        # Convert to lowercase and strip whitespace
-        normalized = term.lower().strip()
-        
-        # Remove common punctuation and special characters, but keep spaces
-        # This helps with abbreviations like "A.I." -> "ai" and "Chat-GPT" -> "chatgpt"
-        normalized = normalized.replace('-', '').replace('_', '').replace('.', '')
-        
-        # Remove extra spaces
-        normalized = ' '.join(normalized.split())
-        
-        return normalized
+        return normalize_term_for_dedup(term)
 
     def _calculate_similarity_threshold(self, term1: str, term2: str) -> int:
         """Calculate dynamic similarity threshold based on term characteristics."""
@@ -347,6 +798,18 @@ class TrendsDataPipeline:
         
         return base_threshold
 
+    def _similarity_thresholds(self, length: int, has_digit: bool, other_lengths: np.ndarray, other_has_digit: np.ndarray) -> np.ndarray:
+        """Vectorized _calculate_similarity_threshold for one term against many."""
+        return np.select(
+            [
+                (length <= 3) | (other_lengths <= 3),    # Shorter terms (likely abbreviations)
+                has_digit | other_has_digit,             # Terms with numbers
+                (length > 20) | (other_lengths > 20)     # Very long terms (more specific)
+            ],
+            [75, 80, 90],
+            default=85
+        )
+
     def _deduplicate_topics(self, topics: List[Dict]) -> List[Dict]:
         """Remove duplicate topics using fuzzy matching with multiple algorithms."""
         if not topics:
@@ -356,80 +819,74 @@ class TrendsDataPipeline:
         
         # Sort topics by score (highest first) to keep best versions
         topics_sorted = sorted(topics, key=lambda x: x['score'], reverse=True)
+        normalized_terms = [normalize_term_for_dedup(t['term']) for t in topics_sorted]
+        
+        # Score all pairs with one batched call per algorithm, keeping the maximum similarity.
+        # No pair threshold is below 75, so rapidfuzz can prune anything under it (scored as 0).
+        min_threshold = 75
+        similarity = np.zeros((len(normalized_terms), len(normalized_terms)))
+        for scorer in (fuzz.ratio, fuzz.partial_ratio, fuzz.token_sort_ratio, fuzz.token_set_ratio):
+            scores = process.cdist(normalized_terms, normalized_terms, scorer=scorer, dtype=np.float64,
+                                   workers=-1, score_cutoff=min_threshold)
+            np.maximum(similarity, scores, out=similarity)
+        
+        # Per-term inputs to the dynamic threshold
+        lengths = np.array([len(term) for term in normalized_terms])
+        has_digit = np.array([any(char.isdigit() for char in term) for term in normalized_terms])
         
-        unique_topics = []
+        # Kept topics as a mask over topics_sorted
+        is_kept = np.zeros(len(topics_sorted), dtype=bool)
         seen_terms = set()
         duplicates_found = 0
         
-        for topic in topics_sorted:
-            term = topic['term']
-            normalized_term = self._normalize_term_for_dedup(term)
+        for i, topic in enumerate(topics_sorted):
+            normalized_term = normalized_terms[i]
             
             # Skip if exact duplicate already processed
             if normalized_term in seen_terms:
                 duplicates_found += 1
                 continue
             
-            # Check for fuzzy duplicates using multiple algorithms
-            is_duplicate = False
-            best_match = None
-            best_similarity = 0
+            # Check for fuzzy duplicates against the topics kept so far. Pairs under the
+            # score cutoff are 0, so only the few nonzero earlier columns need thresholds.
+            candidates = np.flatnonzero(similarity[i, :i])
+            candidates = candidates[is_kept[candidates]]
+            if candidates.size:
+                similarities = similarity[i, candidates]
+                thresholds = self._similarity_thresholds(lengths[i], has_digit[i], lengths[candidates], has_digit[candidates])
+                matches = np.flatnonzero(similarities > thresholds)
+                if matches.size:
+                    # topics_sorted is sorted by score, so the kept topic always scores at least as high
+                    best = matches[np.argmax(similarities[matches])]
+                    best_match = topics_sorted[candidates[best]]
+                    logger.debug(f"Kept '{best_match['term']}' over '{topic['term']}' (similarity: {similarities[best]:.1f}%)")
+                    duplicates_found += 1
+                    continue
             
-            for existing in unique_topics:
-                existing_term = existing['term']
-                existing_normalized = self._normalize_term_for_dedup(existing_term)
-                
-                # Use multiple fuzzy matching algorithms for better accuracy
-                ratio_similarity = fuzz.ratio(normalized_term, existing_normalized)
-                partial_similarity = fuzz.partial_ratio(normalized_term, existing_normalized)
-                token_sort_similarity = fuzz.token_sort_ratio(normalized_term, existing_normalized)
-                token_set_similarity = fuzz.token_set_ratio(normalized_term, existing_normalized)
-                
-                # Take the maximum similarity across all algorithms
-                max_similarity = max(ratio_similarity, partial_similarity, token_sort_similarity, token_set_similarity)
-                
-                # Use dynamic threshold based on term characteristics
-                threshold = self._calculate_similarity_threshold(normalized_term, existing_normalized)
-                
-                # Consider it a duplicate if similarity exceeds threshold
-                if max_similarity > threshold:
-                    if max_similarity > best_similarity:
-                        best_match = existing
-                        best_similarity = max_similarity
-                    is_duplicate = True
-            
-            if is_duplicate and best_match:
-                # Keep the one with higher score (topics_sorted is already sorted by score)
-                if topic['score'] > best_match['score']:
-                    # Replace the existing topic with the better one
-                    unique_topics.remove(best_match)
-                    unique_topics.append(topic)
-                    logger.debug(f"Replaced '{best_match['term']}' with '{topic['term']}' (similarity: {best_similarity:.1f}%)")
-                else:
-                    logger.debug(f"Kept '{best_match['term']}' over '{topic['term']}' (similarity: {best_similarity:.1f}%)")
-                duplicates_found += 1
-            else:
-                # No duplicate found, add to unique topics
-                unique_topics.append(topic)
-                seen_terms.add(normalized_term)
+            # No duplicate found, add to unique topics
+            is_kept[i] = True
+            seen_terms.add(normalized_term)
         
+        unique_topics = [topics_sorted[i] for i in np.flatnonzero(is_kept).tolist()]
         logger.info(f"Deduplication complete: {duplicates_found} duplicates removed, {len(unique_topics)} unique topics remaining")
         return unique_topics
     
     def _passes_quality_filters(self, term: str, sparkline: List[int], slope: float, percent_change: float, volatility: float) -> bool:
         """Apply comprehensive quality filters to determine if a topic should be included."""
+        # Interest values are 0-100, so one int16 array serves every check below
+        y = np.asarray(sparkline, dtype=np.int16)
         
         # 1. Volume threshold check (last 8 weeks median)
-        median_volume = np.median(sparkline[-8:])
-        min_volume = self.seeds_data['globalSettings']['minVolumeThreshold']
+        median_volume = np.median(y[-8:])
+        min_volume = self.min_volume
         
         if median_volume < min_volume:
             logger.debug(f"Skipping {term}: volume too low ({median_volume:.1f} < {min_volume})")
             return False
         
         # 2. Data completeness check (need sufficient data points)
-        if len(sparkline) < 8:
-            logger.debug(f"Skipping {term}: insufficient data ({len(sparkline)} weeks)")
+        if y.size < 8:
+            logger.debug(f"Skipping {term}: insufficient data ({y.size} weeks)")
             return False
         
         # 3. Trend stability check (avoid extremely volatile data)
@@ -439,13 +896,12 @@ class TrendsDataPipeline:
             return False
         
         # 4. Recent activity check (ensure recent data isn't all zeros)
-        recent_weeks = sparkline[-4:]  # Last 4 weeks
-        if all(val == 0 for val in recent_weeks):
+        if not y[-4:].any():  # Last 4 weeks
             logger.debug(f"Skipping {term}: no recent activity")
             return False
         
         # 5. Data consistency check (avoid data with too many zeros)
-        zero_ratio = sum(1 for val in sparkline if val == 0) / len(sparkline)
+        zero_ratio = (y.size - np.count_nonzero(y)) / y.size
         max_zero_ratio = 0.7  # Maximum 70% zeros allowed
         if zero_ratio > max_zero_ratio:
             logger.debug(f"Skipping {term}: too many zeros ({zero_ratio:.1%} > {max_zero_ratio:.1%})")
@@ -457,9 +913,9 @@ class TrendsDataPipeline:
             return False
         
         # 7. Outlier detection (check for suspicious spikes)
-        if len(sparkline) > 4:
-            recent_avg = np.mean(sparkline[-4:])
-            historical_avg = np.mean(sparkline[:-4])
+        if y.size > 4:
+            recent_avg = y[-4:].mean()
+            historical_avg = y[:-4].mean()
             if recent_avg > historical_avg * 10:  # 10x spike might be suspicious
                 logger.debug(f"Skipping {term}: suspicious spike detected")
                 return False
@@ -475,31 +931,34 @@ class TrendsDataPipeline:
         original_count = len(topics)
         logger.info(f"Applying final filtering and capping to {original_count} topics")
         
+        scores = np.fromiter((t['score'] for t in topics), dtype=np.float64, count=original_count)
+        
         # 1. Remove topics with negative scores (not trending)
-        positive_score_topics = [t for t in topics if t['score'] > 0]
-        removed_negative = len(topics) - len(positive_score_topics)
+        keep = np.flatnonzero(scores > 0)
+        removed_negative = original_count - len(keep)
         if removed_negative > 0:
             logger.info(f"Removed {removed_negative} topics with negative scores")
         
         # 2. Apply score-based quality threshold
-        if positive_score_topics:
-            scores = [t['score'] for t in positive_score_topics]
-            score_threshold = np.percentile(scores, 10)  # Keep top 90% by score
-            quality_topics = [t for t in positive_score_topics if t['score'] >= score_threshold]
-            removed_low_quality = len(positive_score_topics) - len(quality_topics)
+        if len(keep):
+            # np.percentile selects with introselect (np.partition), so no full sort is needed
+            score_threshold = np.percentile(scores[keep], 10)  # Keep top 90% by score
+            positive_count = len(keep)
+            keep = keep[scores[keep] >= score_threshold]
+            removed_low_quality = positive_count - len(keep)
             if removed_low_quality > 0:
                 logger.info(f"Removed {removed_low_quality} low-quality topics (score < {score_threshold:.2f})")
-        else:
-            quality_topics = positive_score_topics
         
-        # 3. Apply hard cap of 150 topics
+        # 3. Apply hard cap of 150 topics, highest scores first. nlargest only keeps a
+        # 150-entry heap and is stable like sorted(), so tied topics keep their input order.
         max_topics = 150
-        if len(quality_topics) > max_topics:
-            capped_topics = quality_topics[:max_topics]
-            removed_by_cap = len(quality_topics) - len(capped_topics)
+        if len(keep) > max_topics:
+            removed_by_cap = len(keep) - max_topics
             logger.info(f"Capped to {max_topics} topics (removed {removed_by_cap} lowest scoring)")
-        else:
-            capped_topics = quality_topics
+        keep = heapq.nlargest(max_topics, keep.tolist(), key=scores.__getitem__)
+        
+        capped_topics = [topics[i] for i in keep]
+        capped_scores = scores[keep]
         
         # 4. Ensure category diversity (optional - keep at least 1 topic per category if possible)
         category_counts = {}
@@ -516,9 +975,9 @@ class TrendsDataPipeline:
         total_removed = original_count - final_count
         
         if final_count > 0:
-            avg_score = np.mean([t['score'] for t in capped_topics])
-            min_score = min(t['score'] for t in capped_topics)
-            max_score = max(t['score'] for t in capped_topics)
+            avg_score = capped_scores.mean()
+            min_score = capped_scores.min()
+            max_score = capped_scores.max()
             
             logger.info(f"Final filtering complete:")
             logger.info(f"  Original: {original_count} topics")
@@ -530,76 +989,78 @@ class TrendsDataPipeline:
         
         return capped_topics
     
-    def _process_category(self, category: str, terms: List[str]) -> List[Dict]:
-        """Process all terms in a category and return scored topics."""
-        logger.info(f"Processing category: {category} with {len(terms)} terms")
-        topics = []
+    def _process_term(self, category: str, term: str) -> Optional[Dict]:
+        """Fetch, score and filter a single term, returning its topic entry if it qualifies."""
+        logger.info(f"Processing term: {term}")
         
-        for term in terms:
-            logger.info(f"Processing term: {term}")
-            
-            # Get interest over time data
-            sparkline = self._get_interest_over_time(term)
-            if not sparkline:
-                continue
-            
-            # Calculate score components
-            slope, percent_change, volatility = self._calculate_score(sparkline)
-            
-            # Enhanced volume and quality filtering
-            if not self._passes_quality_filters(term, sparkline, slope, percent_change, volatility):
-                continue
-            
-            # Get related queries
-            related_queries = self._get_related_queries(term)
-            
-            # Create topic entry
-            topic = {
-                'term': term,
-                'category': category,
-                'score': 0.0,  # Will be calculated after normalization
-                'percentChange': percent_change,
-                'sparkline': sparkline,
-                'firstSeen': (datetime.now() - timedelta(weeks=len(sparkline))).isoformat(),
-                'lastSeen': datetime.now().isoformat(),
-                'volume': int(median_volume),
-                'relatedQueries': related_queries[:3],  # Keep top 3 related queries
-                # Debug info (will be removed in production)
-                'debug': {
-                    'slope': slope,
-                    'volatility': volatility,
-                    'medianVolume': median_volume
-                }
+        # Get interest over time data
+        sparkline = self._get_interest_over_time(term)
+        if not sparkline:
+            return None
+        
+        # Calculate score components
+        slope, percent_change, volatility = self._calculate_score(sparkline)
+        
+        # Enhanced volume and quality filtering
+        if not self._passes_quality_filters(term, sparkline, slope, percent_change, volatility):
+            return None
+        
+        # Get related queries from the payload built for the interest data
+        related_queries = self._get_related_queries(term, reuse_payload=True)
+        median_volume = float(np.median(sparkline[-8:]))
+        
+        # Create topic entry
+        return {
+            'term': term,
+            'category': category,
+            'score': 0.0,  # Will be calculated after normalization
+            'percentChange': percent_change,
+            'sparkline': sparkline,
+            'firstSeen': (self.run_started_at - timedelta(weeks=len(sparkline))).isoformat(),
+            'lastSeen': self.run_started_iso,
+            'volume': int(median_volume),
+            'relatedQueries': related_queries[:3],  # Keep top 3 related queries
+            # Debug info (will be removed in production)
+            'debug': {
+                'slope': slope,
+                'volatility': volatility,
+                'medianVolume': median_volume
             }
-            
-            topics.append(topic)
+        }
+    
+    def _batch_slopes_and_volatilities(self, sparklines: List[List[int]]) -> Tuple[np.ndarray, np.ndarray]:
+        """Compute _calculate_score's slope and volatility for many sparklines at once."""
+        lengths = np.array([len(sparkline) for sparkline in sparklines])
         
-        return topics
+        # Slope from the last 8 weeks of every sparkline that has them, as one matrix product
+        slopes = np.zeros(len(sparklines))
+        has_window = lengths >= SLOPE_WINDOW
+        if has_window.any():
+            window = np.array([s[-SLOPE_WINDOW:] for s, ok in zip(sparklines, has_window) if ok], dtype=np.float64)
+            slopes[has_window] = (window @ _SLOPE_XC) / _SLOPE_XC_SS
+        
+        # Volatility over each full sparkline, one std() per distinct sparkline length
+        volatilities = np.zeros(len(sparklines))
+        for length in np.unique(lengths[lengths > 1]):
+            rows = np.flatnonzero(lengths == length)
+            volatilities[rows] = np.array([sparklines[row] for row in rows], dtype=np.float64).std(axis=1)
+        
+        return slopes, volatilities
     
     def _calculate_final_scores(self, all_topics: List[Dict]) -> List[Dict]:
         """Calculate final scores using normalized components."""
         if not all_topics:
             return all_topics
         
-        # Extract components for normalization
-        slopes = []
-        percent_changes = []
-        volatilities = []
+        percent_changes = np.array([topic['percentChange'] for topic in all_topics], dtype=np.float64)
         
-        for topic in all_topics:
-            sparkline = topic['sparkline']
-            if len(sparkline) >= 8:
-                # Calculate actual slope from last 8 weeks
-                last_8_weeks = sparkline[-8:]
-                x = np.arange(len(last_8_weeks))
-                y = np.array(last_8_weeks)
-                slope = np.polyfit(x, y, 1)[0] if len(last_8_weeks) > 1 else 0
-                slopes.append(slope)
-            else:
-                slopes.append(0.0)
-            
-            percent_changes.append(topic['percentChange'])
-            volatilities.append(np.std(sparkline) if len(sparkline) > 1 else 0)
+        # _process_term already computed slope and volatility for each topic; reuse them when present
+        debug_info = [topic.get('debug') for topic in all_topics]
+        if all(debug_info):
+            slopes = np.array([debug['slope'] for debug in debug_info], dtype=np.float64)
+            volatilities = np.array([debug['volatility'] for debug in debug_info], dtype=np.float64)
+        else:
+            slopes, volatilities = self._batch_slopes_and_volatilities([topic['sparkline'] for topic in all_topics])
         
         # Normalize components
         norm_slopes = self._normalize_score(slopes)
@@ -607,156 +1068,26 @@ class TrendsDataPipeline:
         norm_volatilities = self._normalize_score(volatilities)
         
         # Calculate final scores: z(slope) + 0.7·z(%Δ) - 0.3·z(volatility)
-        for i, topic in enumerate(all_topics):
-            topic['score'] = (
-                norm_slopes[i] + 
-                0.7 * norm_percent_changes[i] - 
-                0.3 * norm_volatilities[i]
-            )
+        scores = norm_slopes + 0.7 * norm_percent_changes - 0.3 * norm_volatilities
+        for topic, score in zip(all_topics, scores.tolist()):
+            topic['score'] = score
         
         return all_topics
     
     def _cleanup_archives(self):
         """Keep only the last 7 days of archives with date-based cleanup."""
-        try:
-            if not os.path.exists(self.archive_dir):
-                return
-            
-            archive_files = []
-            current_date = datetime.now().date()
-            
-            # Collect all archive files with their dates
-            for filename in os.listdir(self.archive_dir):
-                if filename.endswith('.json') and filename != 'latest.json':
-                    filepath = os.path.join(self.archive_dir, filename)
-                    
-                    # Try to parse date from filename (YYYY-MM-DD.json)
-                    try:
-                        date_str = filename.replace('.json', '')
-                        file_date = datetime.strptime(date_str, '%Y-%m-%d').date()
-                        
-                        # Calculate days difference
-                        days_old = (current_date - file_date).days
-                        
-                        archive_files.append((filepath, file_date, days_old))
-                    except ValueError:
-                        # If filename doesn't match expected format, use file modification time
-                        mtime = os.path.getmtime(filepath)
-                        file_date = datetime.fromtimestamp(mtime).date()
-                        days_old = (current_date - file_date).days
-                        archive_files.append((filepath, file_date, days_old))
-            
-            # Sort by date (newest first)
-            archive_files.sort(key=lambda x: x[1], reverse=True)
-            
-            # Remove files older than 7 days
-            removed_count = 0
-            for filepath, file_date, days_old in archive_files:
-                if days_old > 7:
-                    try:
-                        os.remove(filepath)
-                        logger.info(f"Removed old archive: {os.path.basename(filepath)} ({days_old} days old)")
-                        removed_count += 1
-                    except OSError as e:
-                        logger.warning(f"Could not remove archive {filepath}: {e}")
-            
-            # Log archive statistics
-            remaining_count = len(archive_files) - removed_count
-            logger.info(f"Archive cleanup complete: {removed_count} removed, {remaining_count} remaining")
-            
-            # List remaining archives
-            if remaining_count > 0:
-                logger.debug("Remaining archives:")
-                for filepath, file_date, days_old in archive_files[:remaining_count]:
-                    logger.debug(f"  {os.path.basename(filepath)} ({days_old} days old)")
-                
-        except Exception as e:
-            logger.error(f"Error cleaning up archives: {e}")
+        cleanup_archives(self.archive_dir)
     
     def _validate_archive(self, filepath: str) -> bool:
         """Validate that an archive file is properly formatted."""
-        try:
-            with open(filepath, 'r') as f:
-                data = json.load(f)
-            
-            # Check required fields
-            required_fields = ['generatedAt', 'totalTopics', 'topics']
-            if not all(field in data for field in required_fields):
-                logger.warning(f"Archive {filepath} missing required fields")
-                return False
-            
-            # Check topics structure
-            if not isinstance(data['topics'], list):
-                logger.warning(f"Archive {filepath} has invalid topics structure")
-                return False
-            
-            # Check topic structure (at least one topic should have required fields)
-            if data['topics']:
-                topic = data['topics'][0]
-                topic_required_fields = ['term', 'category', 'score', 'sparkline']
-                if not all(field in topic for field in topic_required_fields):
-                    logger.warning(f"Archive {filepath} has invalid topic structure")
-                    return False
-            
-            return True
-            
-        except (json.JSONDecodeError, IOError) as e:
-            logger.warning(f"Archive {filepath} is corrupted: {e}")
-            return False
+        return validate_archive(filepath)
     
     def _get_archive_statistics(self) -> Dict:
         """Get statistics about the archive system."""
-        try:
-            if not os.path.exists(self.archive_dir):
-                return {'total_archives': 0, 'total_size_kb': 0, 'oldest_date': None, 'newest_date': None}
-            
-            archive_files = []
-            total_size = 0
-            
-            for filename in os.listdir(self.archive_dir):
-                if filename.endswith('.json') and filename != 'latest.json':
-                    filepath = os.path.join(self.archive_dir, filename)
-                    file_size = os.path.getsize(filepath)
-                    total_size += file_size
-                    
-                    try:
-                        date_str = filename.replace('.json', '')
-                        file_date = datetime.strptime(date_str, '%Y-%m-%d').date()
-                        archive_files.append((filepath, file_date, file_size))
-                    except ValueError:
-                        # Use modification time if filename doesn't match format
-                        mtime = os.path.getmtime(filepath)
-                        file_date = datetime.fromtimestamp(mtime).date()
-                        archive_files.append((filepath, file_date, file_size))
-            
-            if not archive_files:
-                return {'total_archives': 0, 'total_size_kb': 0, 'oldest_date': None, 'newest_date': None}
-            
-            # Sort by date
-            archive_files.sort(key=lambda x: x[1])
-            
-            return {
-                'total_archives': len(archive_files),
-                'total_size_kb': round(total_size / 1024, 1),
-                'oldest_date': archive_files[0][1].isoformat(),
-                'newest_date': archive_files[-1][1].isoformat(),
-                'files': [os.path.basename(f[0]) for f in archive_files]
-            }
-            
-        except Exception as e:
-            logger.error(f"Error getting archive statistics: {e}")
-            return {'error': str(e)}
-    
-    def _clean_debug_info(self, topics: List[Dict]) -> List[Dict]:
-        """Remove debug information from topics before saving."""
-        cleaned_topics = []
-        for topic in topics:
-            cleaned_topic = {k: v for k, v in topic.items() if k != 'debug'}
-            cleaned_topics.append(cleaned_topic)
-        return cleaned_topics
+        return get_archive_statistics(self.archive_dir)
     
-    def _optimize_sparklines(self, topics: List[Dict]) -> List[Dict]:
-        """Optimize sparkline data for performance and file size."""
+    def _finalize_topics(self, topics: List[Dict]) -> List[Dict]:
+        """Trim sparklines and strip debug information in place, in a single pass."""
         for topic in topics:
             sparkline = topic['sparkline']
             
@@ -764,63 +1095,60 @@ class TrendsDataPipeline:
             if len(sparkline) > 24:
                 topic['sparkline'] = sparkline[-24:]
                 logger.debug(f"Trimmed sparkline for {topic['term']} from {len(sparkline)} to 24 points")
+            
+            # Debug information is only used while scoring, never saved
+            topic.pop('debug', None)
         
         return topics
 
     def _save_data(self, topics: List[Dict]):
         """Save topics to latest.json and create archive."""
         try:
-            # Optimize sparklines for performance
-            optimized_topics = self._optimize_sparklines(topics)
-            
-            # Clean debug information
-            cleaned_topics = self._clean_debug_info(optimized_topics)
+            # Trim sparklines and clean debug information
+            cleaned_topics = self._finalize_topics(topics)
             
             # Create output data structure
+            now = datetime.now()
             output_data = {
-                'generatedAt': datetime.now().isoformat(),
+                'generatedAt': now.isoformat(),
                 'totalTopics': len(cleaned_topics),
                 'topics': cleaned_topics
             }
             
-            # Save latest.json
-            with open(self.latest_file, 'w') as f:
-                json.dump(output_data, f, indent=2)
+            # Serialize once, compactly; latest.json and the archive share the same bytes.
+            # Indenting would put every sparkline value on its own line.
+            payload = dump_json(output_data)
+            
+            # Save latest.json atomically, so the site never serves a half-written file
+            write_atomic(self.latest_file, payload)
             
             logger.info(f"Saved {len(topics)} topics to {self.latest_file}")
             
             # Create archive with validation
-            archive_filename = f"{datetime.now().strftime('%Y-%m-%d')}.json"
+            date_str = now.strftime('%Y-%m-%d')
+            archive_filename = f"{date_str}.json"
             archive_path = os.path.join(self.archive_dir, archive_filename)
             
             # Check if archive already exists for today
             if os.path.exists(archive_path):
                 logger.warning(f"Archive for today already exists: {archive_filename}")
                 # Create backup with timestamp
-                timestamp = datetime.now().strftime('%H%M%S')
-                backup_filename = f"{datetime.now().strftime('%Y-%m-%d')}_{timestamp}.json"
+                timestamp = now.strftime('%H%M%S')
+                backup_filename = f"{date_str}_{timestamp}.json"
                 backup_path = os.path.join(self.archive_dir, backup_filename)
                 archive_path = backup_path
                 archive_filename = backup_filename
             
-            with open(archive_path, 'w') as f:
-                json.dump(output_data, f, indent=2)
-            
-            # Validate the created archive
-            if self._validate_archive(archive_path):
+            # Validate the in-memory document before writing; write_atomic stores payload
+            # verbatim, so re-reading the file would only parse the same data again
+            if validate_archive_data(output_data, archive_filename):
+                write_atomic(archive_path, payload)
                 logger.info(f"Created and validated archive: {archive_filename}")
             else:
-                logger.error(f"Archive validation failed: {archive_filename}")
-                # Remove invalid archive
-                try:
-                    os.remove(archive_path)
-                    logger.info(f"Removed invalid archive: {archive_filename}")
-                except OSError:
-                    pass
+                logger.error(f"Archive validation failed, not written: {archive_filename}")
             
-            # Check file size and log warning if too large
-            file_size = os.path.getsize(self.latest_file)
-            file_size_kb = file_size / 1024
+            # Check file size and log warning if too large (latest.json holds exactly payload)
+            file_size_kb = len(payload) / 1024
             
             if file_size_kb > 400:
                 logger.warning(f"Output file is large: {file_size_kb:.1f}KB (target: <400KB)")
@@ -847,35 +1175,43 @@ class TrendsDataPipeline:
         """Run the complete data pipeline with comprehensive error handling."""
         logger.info("Starting Rising Topics data pipeline")
         start_time = time.time()
-        self.error_tracker.metrics['start_time'] = datetime.now().isoformat()
+        self._set_run_timestamp()
         
         try:
             all_topics = []
             categories_processed = 0
             total_terms_processed = 0
             
-            # Process each category
-            for category, config in self.seeds_data['categories'].items():
-                try:
+            # Queue every term of every category on one pool, so workers stay busy across
+            # category boundaries, then collect each category's results in seed order
+            with ThreadPoolExecutor(max_workers=self.fetch_workers) as executor:
+                pending = [
+                    (category, config, [executor.submit(self._process_term, category, term) for term in config['terms']])
+                    for category, config in self.seeds_data['categories'].items()
+                ]
+                
+                # Process each category
+                for category, config, futures in pending:
                     terms = config['terms']
                     logger.info(f"Processing category: {category} with {len(terms)} terms")
                     
-                    category_topics = self._process_category(category, terms)
-                    all_topics.extend(category_topics)
-                    
-                    categories_processed += 1
-                    total_terms_processed += len(terms)
-                    
-                    logger.info(f"Category {category} completed: {len(category_topics)} topics collected")
-                    
-                except Exception as e:
-                    self.error_tracker.log_error(
-                        'CATEGORY_PROCESSING_ERROR',
-                        f"Failed to process category {category}: {str(e)}",
-                        {'category': category, 'terms_count': len(config['terms']), 'error': str(e)}
-                    )
-                    # Continue with other categories
-                    continue
+                    try:
+                        category_topics = [topic for topic in (future.result() for future in futures) if topic]
+                        all_topics.extend(category_topics)
+                        
+                        categories_processed += 1
+                        total_terms_processed += len(terms)
+                        
+                        logger.info(f"Category {category} completed: {len(category_topics)} topics collected")
+                        
+                    except Exception as e:
+                        self.error_tracker.log_error(
+                            'CATEGORY_PROCESSING_ERROR',
+                            f"Failed to process category {category}: {str(e)}",
+                            {'category': category, 'terms_count': len(terms), 'error': str(e)}
+                        )
+                        # Continue with other categories
+                        continue
             
             logger.info(f"Collected {len(all_topics)} topics before deduplication")
             self.error_tracker.metrics['topics_before_dedup'] = len(all_topics)
@@ -907,10 +1243,7 @@ class TrendsDataPipeline:
                 # Continue with unscored topics
                 pass
             
-            # Sort by score (highest first)
-            all_topics.sort(key=lambda x: x.get('score', 0), reverse=True)
-            
-            # Apply intelligent capping and filtering
+            # Apply intelligent capping and filtering (returns topics sorted by score, highest first)
             try:
                 all_topics = self._apply_final_filtering_and_capping(all_topics)
                 logger.info("Final filtering and capping completed")
@@ -921,13 +1254,14 @@ class TrendsDataPipeline:
                     f"Failed to apply final filtering: {str(e)}",
                     {'topics_count': len(all_topics), 'error': str(e)}
                 )
-                # Continue with unfiltered topics
-                pass
+                # Continue with unfiltered topics, sorted by score (highest first)
+                all_topics.sort(key=lambda x: x.get('score', 0), reverse=True)
             
             # Save data
             try:
                 self._save_data(all_topics)
                 logger.info("Data saved successfully")
+                self._cleanup_cache()
             except Exception as e:
                 self.error_tracker.log_error(
                     'SAVE_ERROR',
@@ -952,7 +1286,7 @@ class TrendsDataPipeline:
             self.error_tracker.log_error(
                 'PIPELINE_CRITICAL_ERROR',
                 f"Pipeline failed with critical error: {str(e)}",
-                {'error': str(e), 'traceback': str(e.__traceback__)}
+                {'error': str(e), 'traceback': traceback.format_exc()}
             )
             logger.error(f"Pipeline failed: {e}")
             return False
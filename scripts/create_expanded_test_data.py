@@ -5,7 +5,7 @@ Create expanded test data with more categories and realistic topics
 
 import json
 import random
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
 def generate_expanded_topics():
     """Generate realistic trending topics with expanded categories"""
@@ -63,8 +63,10 @@ def generate_expanded_topics():
         ]
     }
     
-    # Generate realistic data
+    # Generate realistic data, stamping every topic from one clock reading
     topics = []
+    now_utc = datetime.now(timezone.utc)
+    last_seen = now_utc.isoformat()
     
     for category, terms in trending_topics.items():
         # Select 3-5 random terms from each category
@@ -81,8 +83,7 @@ def generate_expanded_topics():
             score = calculate_score(sparkline, percent_change)
             
             # Generate realistic dates
-            first_seen = generate_first_seen_date()
-            last_seen = datetime.now(timezone.utc).isoformat()
+            first_seen = generate_first_seen_date(now_utc)
             
             # Generate related queries
             related_queries = generate_related_queries(term, category)
@@ -130,10 +131,7 @@ def calculate_score(sparkline, percent_change):
     base_score = min(10, percent_change / 50)
     
     # Add score for trend consistency
-    trend_score = 0
-    for i in range(1, len(sparkline)):
-        if sparkline[i] > sparkline[i-1]:
-            trend_score += 0.5
+    trend_score = 0.5 * sum(b > a for a, b in zip(sparkline, sparkline[1:]))
     
     # Add score for recent growth
     recent_growth = (sparkline[-1] - sparkline[-3]) / sparkline[-3] if sparkline[-3] > 0 else 0
@@ -142,11 +140,11 @@ def calculate_score(sparkline, percent_change):
     total_score = base_score + trend_score + growth_score
     return min(10, max(1, total_score))
 
-def generate_first_seen_date():
+def generate_first_seen_date(now=None):
     """Generate a realistic first seen date"""
     # Random date between 6 months ago and 2 years ago
     days_ago = random.randint(180, 730)
-    first_seen = datetime.now(timezone.utc) - timedelta(days=days_ago)
+    first_seen = (now or datetime.now(timezone.utc)) - timedelta(days=days_ago)
     return first_seen.isoformat()
 
 def generate_related_queries(term, category):
@@ -207,7 +205,7 @@ def main():
     # Save to latest.json
     output_file = "public/data/latest.json"
     with open(output_file, 'w') as f:
-        json.dump(response, f, indent=2)
+        json.dump(response, f, separators=(',', ':'))
     
     print(f"✅ Generated {len(topics)} expanded trending topics")
     print(f"📁 Saved to {output_file}")
@@ -228,5 +226,4 @@ def main():
         print(f"  {i+1}. {topic['term']} ({topic['category']}) - Score: {topic['score']}, Growth: +{topic['percentChange']}%")
 
 if __name__ == "__main__":
-    from datetime import timedelta
     main()
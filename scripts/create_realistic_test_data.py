@@ -228,7 +228,7 @@ def main():
     # Save to latest.json
     output_file = "public/data/latest.json"
     with open(output_file, 'w') as f:
-        json.dump(response, f, indent=2)
+        json.dump(response, f, separators=(',', ':'))
     
     print(f"✅ Generated {len(topics)} realistic trending topics")
     print(f"📁 Saved to {output_file}")
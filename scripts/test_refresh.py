@@ -20,7 +20,7 @@ def test_refresh():
     data['generatedAt'] = datetime.now().isoformat()
     
     with open('public/data/latest.json', 'w') as f:
-        json.dump(data, f, indent=2)
+        json.dump(data, f, separators=(',', ':'))
     
     new_timestamp = data['generatedAt']
     print(f"📝 Updated timestamp from {old_timestamp} to {new_timestamp}")
@@ -18,7 +18,7 @@ def update_timestamp():
         
         # Write back to file
         with open('public/data/latest.json', 'w') as f:
-            json.dump(data, f, indent=2)
+            json.dump(data, f, separators=(',', ':'))
         
         print(f"✅ Updated timestamp to: {data['generatedAt']}")
         return True
@@ -8,6 +8,7 @@ import os
 sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "scripts"))
 
 from build_data import TrendsDataPipeline
+import numpy as np
 
 def create_test_topic(term, category, score):
     """Create a test topic with mock data."""
@@ -70,6 +71,28 @@ def test_dynamic_thresholds():
             print(f"✅ '{term1}' vs '{term2}' -> {result}% threshold")
         else:
             print(f"❌ '{term1}' vs '{term2}' -> {result}% threshold (expected {expected}%)")
+    
+    # Deduplication uses the vectorized form; it must agree with the scalar rules,
+    # including where they overlap (numbers in very long or very short terms)
+    print("\nTesting vectorized thresholds match scalar thresholds...")
+    terms = [term for pair in test_cases for term in pair[:2]]
+    terms += ["GPT4", "Claude 3.5 Sonnet vs GPT-4o comparison", "Stable Diffusion Image Generator"]
+    lengths = np.array([len(term) for term in terms])
+    has_digit = np.array([any(char.isdigit() for char in term) for term in terms])
+    
+    mismatches = []
+    for i, term1 in enumerate(terms):
+        vectorized = pipeline._similarity_thresholds(lengths[i], has_digit[i], lengths, has_digit)
+        for j, term2 in enumerate(terms):
+            scalar = pipeline._calculate_similarity_threshold(term1, term2)
+            if vectorized[j] != scalar:
+                mismatches.append((term1, term2, scalar, int(vectorized[j])))
+    
+    if not mismatches:
+        print(f"✅ Vectorized thresholds match for all {len(terms) ** 2} term pairs")
+    else:
+        for term1, term2, scalar, vectorized in mismatches:
+            print(f"❌ '{term1}' vs '{term2}' -> {vectorized}% vectorized, {scalar}% scalar")
 
 def test_advanced_deduplication():
     """Test advanced deduplication scenarios."""
@@ -235,6 +235,124 @@ def test_duplicate_archive_handling():
         print(f"❌ Duplicate handling failed: {len(archive_files)} files for {today}")
         return False
 
+def test_validation_cache():
+    """Test that archive_manager only re-validates new or changed archives."""
+    print("\nTesting validation cache...")
+    
+    import io
+    import tempfile
+    import contextlib
+    import build_data
+    import archive_manager
+    
+    original_archive_dir = build_data.ARCHIVE_DIR
+    original_cache_dir = build_data.CACHE_DIR
+    original_batch = build_data.validate_archives_batch
+    validated = []
+    
+    def recording_batch(paths):
+        validated.append(sorted(os.path.basename(p) for p in paths))
+        return original_batch(paths)
+    
+    with tempfile.TemporaryDirectory() as archive_dir, tempfile.TemporaryDirectory() as cache_dir:
+        for date_str in ["2024-01-10", "2024-01-11"]:
+            with open(os.path.join(archive_dir, f"{date_str}.json"), 'w') as f:
+                json.dump(create_test_archive_data(date_str, 3), f)
+        
+        build_data.ARCHIVE_DIR = archive_dir
+        build_data.CACHE_DIR = cache_dir
+        build_data.validate_archives_batch = recording_batch
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                archive_manager.validate_archives()
+                archive_manager.validate_archives()
+                
+                # Rewrite one archive so its size and mtime both change
+                modified_path = os.path.join(archive_dir, "2024-01-11.json")
+                with open(modified_path, 'w') as f:
+                    json.dump(create_test_archive_data("2024-01-11", 4), f)
+                stat = os.stat(modified_path)
+                os.utime(modified_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+                archive_manager.validate_archives()
+            
+            # The cache lives with the pipeline cache, never in the served archive directory
+            archive_dir_files = sorted(os.listdir(archive_dir))
+            cache_dir_files = os.listdir(cache_dir)
+        finally:
+            build_data.ARCHIVE_DIR = original_archive_dir
+            build_data.CACHE_DIR = original_cache_dir
+            build_data.validate_archives_batch = original_batch
+    
+    passed = True
+    if archive_dir_files == ["2024-01-10.json", "2024-01-11.json"] and \
+            cache_dir_files == [archive_manager.VALIDATION_CACHE_NAME]:
+        print("✅ Validation cache stored outside the archive directory")
+    else:
+        print(f"❌ Unexpected files: archive dir {archive_dir_files}, cache dir {cache_dir_files}")
+        passed = False
+    
+    expected = [["2024-01-10.json", "2024-01-11.json"], [], ["2024-01-11.json"]]
+    if validated == expected:
+        print("✅ Unchanged archives skipped, modified archive re-validated")
+    else:
+        print(f"❌ Unexpected validation batches: {validated}")
+        passed = False
+    
+    return passed
+
+def test_batch_validation_serial():
+    """Test that a normal 7-day archive window is validated without a process pool."""
+    print("\nTesting batch validation of a normal archive window...")
+    
+    import tempfile
+    import build_data
+    
+    pool_starts = []
+    
+    class RecordingPool:
+        """Fails the test path if validate_archives_batch starts worker processes."""
+        def __init__(self, *args, **kwargs):
+            pool_starts.append(kwargs)
+            raise RuntimeError("process pool started for a small batch")
+    
+    original_pool = build_data.ProcessPoolExecutor
+    with tempfile.TemporaryDirectory() as archive_dir:
+        paths = []
+        for i in range(8):  # 7 days of archives plus a same-day backup
+            date_str = (datetime.now() - timedelta(days=i)).strftime('%Y-%m-%d')
+            path = os.path.join(archive_dir, f"{date_str}.json")
+            with open(path, 'w') as f:
+                json.dump(create_test_archive_data(date_str, 5), f)
+            paths.append(path)
+        
+        corrupted_path = os.path.join(archive_dir, "corrupted.json")
+        with open(corrupted_path, 'w') as f:
+            f.write('{"generatedAt": "2024-01-15T12:00:00", "topics": [')
+        paths.append(corrupted_path)
+        
+        # Pretend to be a multi-core machine so the pool decision doesn't depend on the host
+        original_cpu_count = os.cpu_count
+        build_data.ProcessPoolExecutor = RecordingPool
+        os.cpu_count = lambda: 8
+        try:
+            results = build_data.validate_archives_batch(paths)
+        except RuntimeError:
+            results = None
+        finally:
+            build_data.ProcessPoolExecutor = original_pool
+            os.cpu_count = original_cpu_count
+    
+    expected = {path: path != corrupted_path for path in paths}
+    if pool_starts:
+        print("❌ Process pool started for a normal archive window")
+        return False
+    elif results != expected:
+        print(f"❌ Unexpected validation results: {results}")
+        return False
+    else:
+        print(f"✅ {len(paths)} archives validated serially with correct results")
+        return True
+
 def cleanup_test_archives():
     """Clean up all test archives."""
     pipeline = TrendsDataPipeline()
@@ -254,6 +372,8 @@ if __name__ == "__main__":
         test_archive_validation()
         test_archive_statistics()
         test_duplicate_archive_handling()
+        test_validation_cache()
+        test_batch_validation_serial()
         
         print("\n🎉 All archive system tests completed!")
         
@@ -11,7 +11,7 @@ import shutil
 from datetime import datetime
 sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "scripts"))
 
-from build_data import TrendsDataPipeline, ErrorTracker
+from build_data import TrendsDataPipeline, ErrorTracker, TooManyRequestsError
 
 def test_error_tracker():
     """Test the ErrorTracker class functionality."""
@@ -184,6 +184,84 @@ def test_api_error_handling():
         print(f"❌ Unexpected error in API test: {e}")
         return False
 
+def test_rate_limit_backoff():
+    """Test that a 429 from Google pauses requests for every fetch thread."""
+    print("\nTesting rate limit backoff...")
+    
+    import time
+    import requests
+    
+    pipeline = TrendsDataPipeline()
+    pipeline.cache_dir = tempfile.mkdtemp()
+    client = pipeline._get_client()
+    
+    # urllib3 must hand 429s back instead of retrying them inside one worker
+    retry = client._get_session().get_adapter('https://trends.google.com').max_retries
+    if retry.is_retry('GET', 429, has_retry_after=True):
+        print("❌ Session adapter retries 429 responses itself")
+        return False
+    print("✅ Session adapter leaves 429 responses to the pipeline")
+    
+    class RateLimitedSession:
+        """Stands in for the keep-alive session; Google answers every call with 429."""
+        def get(self, url, **kwargs):
+            response = requests.Response()
+            response.status_code = 429
+            response.headers['Retry-After'] = '120'
+            response.url = url
+            response._content = b''
+            return response
+        post = get
+    
+    client._session = RateLimitedSession()
+    try:
+        started = time.time()
+        result = pipeline._get_interest_over_time("rate limited term")
+    finally:
+        shutil.rmtree(pipeline.cache_dir, ignore_errors=True)
+    
+    print(f"  Result: {result}")
+    print(f"  Requests paused for: {pipeline.paused_until - started:.0f}s")
+    
+    if result is None and pipeline.paused_until >= started + 120:
+        print("✅ 429 paused requests for Retry-After")
+    else:
+        print("❌ 429 did not pause requests")
+        return False
+    
+    # A thread already sleeping on a reserved slot must not send during a later pause
+    import threading
+    import build_data
+    
+    original_uniform = build_data.random.uniform
+    build_data.random.uniform = lambda a, b: 0  # No jitter, so the timings below are exact
+    try:
+        pipeline.paused_until = 0
+        pipeline.min_delay = 0.5
+        pipeline.last_request_time = time.time()  # A request was just sent
+        
+        released = []
+        waiter = threading.Thread(target=lambda: (pipeline._rate_limit(), released.append(time.time())))
+        waiter.start()
+        time.sleep(0.1)  # Waiter is now sleeping on the slot 0.5s after the last request
+        
+        response = requests.Response()
+        response.status_code = 429
+        response.headers['Retry-After'] = '2'
+        pipeline._back_off(TooManyRequestsError.from_response(response))
+        paused_until = pipeline.paused_until
+        waiter.join(timeout=10)
+    finally:
+        build_data.random.uniform = original_uniform
+    
+    if released and released[0] >= paused_until:
+        print(f"✅ Sleeping thread held until the pause ended ({released[0] - paused_until:.2f}s after)")
+        return True
+    else:
+        print(f"❌ Sleeping thread sent {paused_until - released[0]:.2f}s before the pause ended" if released
+              else "❌ Sleeping thread never proceeded")
+        return False
+
 def test_log_rotation():
     """Test log file rotation and management."""
     print("\nTesting log file management...")
@@ -257,6 +335,7 @@ if __name__ == "__main__":
         test_pipeline_error_handling,
         test_file_operations_error_handling,
         test_api_error_handling,
+        test_rate_limit_backoff,
         test_log_rotation,
         test_error_recovery
     ]
@@ -73,8 +73,7 @@ def test_file_size_optimization():
     pipeline = TrendsDataPipeline()
     
     # Apply optimization
-    optimized_topics = pipeline._optimize_sparklines(large_topics)
-    cleaned_topics = pipeline._clean_debug_info(optimized_topics)
+    cleaned_topics = pipeline._finalize_topics(large_topics)
     
     optimized_data = {
         'generatedAt': '2024-01-15T00:00:00',
@@ -100,7 +99,7 @@ def test_file_size_optimization():
     
     # Verify sparkline lengths
     original_lengths = [len(t['sparkline']) for t in large_topics]
-    optimized_lengths = [len(t['sparkline']) for t in optimized_topics]
+    optimized_lengths = [len(t['sparkline']) for t in cleaned_topics]
     
     print(f"\nSparkline length statistics:")
     print(f"  Original: {min(original_lengths)} to {max(original_lengths)} points (avg: {np.mean(original_lengths):.1f})")
@@ -9,6 +9,10 @@ sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '
 
 from build_data import TrendsDataPipeline
 import json
+import time
+import shutil
+import tempfile
+from datetime import timedelta
 
 def test_pipeline():
     """Test the pipeline with a small subset of data."""
@@ -57,5 +61,61 @@ def test_pipeline():
     if os.path.exists("data/test_seeds.json"):
         os.remove("data/test_seeds.json")
 
+def test_response_cache():
+    """Test the per-day API response cache: hits, day rollover, expiry and corrupt entries."""
+    print("\nTesting API response cache...")
+    
+    pipeline = TrendsDataPipeline()
+    pipeline.cache_dir = tempfile.mkdtemp()
+    values = [10, 20, 30, 40, 50, 60, 70, 80]
+    passed = True
+    
+    try:
+        cache_path = pipeline._cache_path('interest', 'cached term', 'today 12-m')
+        pipeline._write_cache(cache_path, values)
+        
+        # Fresh entry is served without an API call
+        result = pipeline._get_interest_over_time('cached term')
+        if result == values and pipeline.error_tracker.metrics['api_calls'] == 0:
+            print("✅ Cached response served without an API call")
+        else:
+            print(f"❌ Cache hit returned {result} after {pipeline.error_tracker.metrics['api_calls']} API calls")
+            passed = False
+        
+        # Google revises the partial last week daily, so the next day's run must not reuse it
+        run_started_at = pipeline.run_started_at
+        pipeline.run_started_at = run_started_at + timedelta(days=1)
+        next_day_path = pipeline._cache_path('interest', 'cached term', 'today 12-m')
+        pipeline.run_started_at = run_started_at
+        if next_day_path != cache_path:
+            print("✅ Cache key rolls over the next day")
+        else:
+            print("❌ Next day's run reuses today's cache entry")
+            passed = False
+        
+        # Entry older than the TTL is a miss
+        expired = time.time() - pipeline.cache_ttl - 60
+        os.utime(cache_path, (expired, expired))
+        if pipeline._read_cache(cache_path) is None:
+            print("✅ Expired cache entry ignored")
+        else:
+            print("❌ Expired cache entry was served")
+            passed = False
+        
+        # Truncated or non-list entries are misses, not errors
+        for label, content in (("Truncated", b'[10, 20, 3'), ("Non-list", b'{"values": [10, 20]}')):
+            with open(cache_path, 'wb') as f:
+                f.write(content)
+            if pipeline._read_cache(cache_path) is None:
+                print(f"✅ {label} cache entry ignored")
+            else:
+                print(f"❌ {label} cache entry was served")
+                passed = False
+    finally:
+        shutil.rmtree(pipeline.cache_dir, ignore_errors=True)
+    
+    return passed
+
 if __name__ == "__main__":
     test_pipeline()
+    test_response_cache()
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Test script for PooledTrendReq response parsing against canned Google Trends responses
+"""
+
+import sys
+import os
+import json
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "scripts"))
+
+import requests
+from build_data import PooledTrendReq, ResponseError, TrendReq
+
+KEYWORDS = ['alpha', 'beta', 'gamma']
+
+def make_response(body, status=200, content_type='application/json; charset=utf-8'):
+    """Build a requests.Response the way the keep-alive session would return it."""
+    response = requests.Response()
+    response.status_code = status
+    response.headers['Content-Type'] = content_type
+    response._content = body.encode()
+    return response
+
+def explore_body():
+    """Widget list for KEYWORDS, behind the 4-character anti-XSSI prefix explore uses."""
+    widgets = [{'id': 'TIMESERIES', 'request': {'keywords': KEYWORDS}, 'token': 'timeseries-token'}]
+    for kw in KEYWORDS:
+        widgets.append({
+            'id': 'RELATED_QUERIES',
+            'token': f'{kw}-token',
+            'request': {'restriction': {'complexKeywordsRestriction': {'keyword': [{'value': kw}]}}}
+        })
+    return ")]}'" + json.dumps({'widgets': widgets})
+
+def widget_body(data):
+    """Widget data behind the 5-character ")]}'," prefix (plus newline) Google sends."""
+    return ")]}',\n" + json.dumps({'default': data})
+
+# Weekly points deliberately out of order; 'value' holds one entry per keyword
+TIMELINE = [
+    {'time': '1700604800', 'value': [30, 3, 0], 'isPartial': True},
+    {'time': '1699395200', 'value': [10, 1, 0]},
+    {'time': '1700000000', 'value': [20, 2, 0]},
+]
+
+RANKED_LISTS = {
+    # Both lists present
+    'alpha': [{'rankedKeyword': [{'query': 'alpha top', 'value': 100}, {'query': 'alpha news', 'value': 80}]},
+              {'rankedKeyword': [{'query': 'alpha rising', 'value': 5000}]}],
+    # Empty top list, rising list without rankedKeyword
+    'beta': [{'rankedKeyword': []}, {}],
+    # No rising list at all
+    'gamma': [{'rankedKeyword': [{'query': 'gamma top', 'value': 100}]}],
+}
+
+class FakeTrendsSession:
+    """Stands in for the keep-alive requests session, answering from canned payloads."""
+
+    def __init__(self, timeline=TIMELINE, ranked_lists=RANKED_LISTS):
+        self.timeline = timeline
+        self.ranked_lists = ranked_lists
+        self.requests = []
+
+    def get(self, url, params=None, **kwargs):
+        self.requests.append(url)
+        if url == TrendReq.GENERAL_URL:
+            return make_response(explore_body(), content_type='application/javascript; charset=utf-8')
+        if url == TrendReq.INTEREST_OVER_TIME_URL:
+            return make_response(widget_body({'timelineData': self.timeline}))
+        if url == TrendReq.RELATED_QUERIES_URL:
+            request = json.loads(params['req'])
+            kw = request['restriction']['complexKeywordsRestriction']['keyword'][0]['value']
+            return make_response(widget_body({'rankedList': self.ranked_lists[kw]}))
+        return make_response('<html>Not Found</html>', status=404, content_type='text/html')
+
+    post = get
+
+class OfflineTrendReq(PooledTrendReq):
+    """PooledTrendReq that skips the cookie request made on construction."""
+
+    def GetGoogleCookie(self):
+        return {}
+
+def make_client(session):
+    """Create a client whose requests all go to the given fake session."""
+    client = OfflineTrendReq(hl='en-US', tz=360)
+    client._session = session
+    client.build_payload(KEYWORDS, timeframe='today 12-m')
+    return client
+
+def test_build_payload():
+    """Test that explore widgets are parsed after trimming the anti-XSSI prefix."""
+    print("Testing explore widget parsing...")
+
+    client = make_client(FakeTrendsSession())
+
+    related_keywords = [w['request']['restriction']['complexKeywordsRestriction']['keyword'][0]['value']
+                        for w in client.related_queries_widget_list]
+    if client.interest_over_time_widget['token'] == 'timeseries-token' and related_keywords == KEYWORDS:
+        print("✅ Interest and related query widgets parsed")
+        return True
+    else:
+        print(f"❌ Unexpected widgets: {client.interest_over_time_widget}, {related_keywords}")
+        return False
+
+def test_interest_values():
+    """Test timeline parsing: sorted by time, one list of ints per keyword."""
+    print("\nTesting interest_values parsing...")
+
+    client = make_client(FakeTrendsSession())
+    values = client.interest_values()
+
+    expected = {'alpha': [10, 20, 30], 'beta': [1, 2, 3], 'gamma': [0, 0, 0]}
+    print(f"  Values: {values}")
+
+    if values == expected:
+        print("✅ Timeline sorted by time and split per keyword")
+    else:
+        print(f"❌ Expected {expected}")
+        return False
+
+    # A keyword Google has no data for comes back with an empty timeline
+    client = make_client(FakeTrendsSession(timeline=[]))
+    values = client.interest_values()
+    if values == {kw: [] for kw in KEYWORDS}:
+        print("✅ Empty timeline gives empty value lists")
+        return True
+    else:
+        print(f"❌ Empty timeline gave {values}")
+        return False
+
+def test_related_query_lists():
+    """Test ranked list parsing, including empty and missing lists."""
+    print("\nTesting related_query_lists parsing...")
+
+    client = make_client(FakeTrendsSession())
+    related = client.related_query_lists()
+
+    expected = {
+        'alpha': {'top': ['alpha top', 'alpha news'], 'rising': ['alpha rising']},
+        'beta': {'top': None, 'rising': None},
+        'gamma': {'top': ['gamma top'], 'rising': None},
+    }
+    print(f"  Related: {related}")
+
+    if related == expected:
+        print("✅ Top and rising queries parsed; empty or missing lists are None")
+        return True
+    else:
+        print(f"❌ Expected {expected}")
+        return False
+
+def test_error_response():
+    """Test that a non-JSON error page raises ResponseError."""
+    print("\nTesting error responses...")
+
+    client = make_client(FakeTrendsSession())
+    try:
+        client._get_data('https://trends.google.com/trends/api/missing', trim_chars=5)
+    except ResponseError as e:
+        print(f"✅ Error page raised ResponseError: {e}")
+        return True
+
+    print("❌ Error page did not raise ResponseError")
+    return False
+
+if __name__ == "__main__":
+    print("Testing Google Trends Client Parsing")
+    print("=" * 50)
+
+    tests = [
+        test_build_payload,
+        test_interest_values,
+        test_related_query_lists,
+        test_error_response
+    ]
+
+    passed = 0
+    for test in tests:
+        try:
+            if test():
+                passed += 1
+        except Exception as e:
+            print(f"❌ Test {test.__name__} failed with exception: {e}")
+
+    print("\n" + "=" * 50)
+    print(f"Trends Client Tests: {passed}/{len(tests)} passed")
+
+    sys.exit(0 if passed == len(tests) else 1)